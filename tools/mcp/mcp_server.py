@@ -1,8 +1,10 @@
 #!/usr/bin/env python3
-import sys, importlib
+import sys, importlib, importlib.util
 import os
+import threading
+import time
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 from fastmcp import FastMCP
 
 mcp = FastMCP("roslyn-analyzers-dev")
@@ -13,22 +15,96 @@ MCP_DIR = Path(__file__).parent
 if str(MCP_DIR) not in sys.path:
     sys.path.insert(0, str(MCP_DIR))
 
-# Import ra_tools directly 
+# Import ra_tools directly. ra_state holds long-lived state and is never reloaded.
+import ra_state
 import ra_tools
 
+RA_TOOLS_PATH = MCP_DIR / "ra_tools.py"
+WATCH_INTERVAL = 0.5
+_reload_lock = threading.Lock()
+# Last mtime loaded per file, shared by hot_reload and the watcher so neither reloads a change twice
+_loaded_mtimes: Dict[Path, Optional[int]] = {}
+
 def _mod():
     # Set the base directory and return the ra_tools module
     ra_tools.set_base_dir(str(BASE_DIR))
     return ra_tools
 
+def _mtime(path: Path) -> Optional[int]:
+    try:
+        return path.stat().st_mtime_ns
+    except FileNotFoundError:
+        # Editors that save by rename briefly remove the file
+        return None
+
+def _reload(path: Optional[Path] = None, only_if_changed: bool = False) -> Optional[Dict[str, Any]]:
+    """Execute ra_tools.py into a fresh module and swap it in only if it imports cleanly.
+
+    With only_if_changed, returns None without reloading when the file is missing or unchanged since the last load.
+    """
+    global ra_tools
+    path = path or RA_TOOLS_PATH
+    with _reload_lock:
+        mtime = _mtime(path)
+        if only_if_changed and (mtime is None or mtime == _loaded_mtimes.get(path)):
+            return None
+        # Recorded even if the import fails, so a broken file is not retried until it changes again
+        _loaded_mtimes[path] = mtime
+        start = time.perf_counter()
+        importlib.invalidate_caches()
+        spec = importlib.util.spec_from_file_location("ra_tools", path)
+        module = importlib.util.module_from_spec(spec)
+        previous = sys.modules.get("ra_tools")
+        sys.modules["ra_tools"] = module
+        try:
+            spec.loader.exec_module(module)
+        except Exception as e:
+            # Keep serving the previous implementation; a half-saved or broken file must not take the tools down
+            if previous is not None:
+                sys.modules["ra_tools"] = previous
+            else:
+                sys.modules.pop("ra_tools", None)
+            return {"status": "skipped", "reloaded": None, "error": f"{type(e).__name__}: {e}",
+                    "base_dir": str(BASE_DIR)}
+        ra_tools = module
+        ra_tools.set_base_dir(str(BASE_DIR))
+        return {"status": "ok", "reloaded": "ra_tools", "base_dir": str(BASE_DIR),
+                "duration_ms": round((time.perf_counter() - start) * 1000, 1), "caches": ra_state.stats()}
+
+def _watch(path: Path, interval: float, stop: threading.Event) -> None:
+    while not stop.wait(interval):
+        result = _reload(path, only_if_changed=True)
+        if result is not None:
+            # stdout carries the MCP protocol, so report on stderr
+            print(f"ra_tools auto reload: {result['status']} {result.get('error', '')}".rstrip(), file=sys.stderr)
+
+class Watcher:
+    """Handle for a running ra_tools.py watcher."""
+
+    def __init__(self, thread: threading.Thread, stop: threading.Event):
+        self._thread = thread
+        self._stop = stop
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """Stop polling and wait for the watcher thread to exit."""
+        self._stop.set()
+        self._thread.join(timeout)
+
+def start_watcher(path: Optional[Path] = None, interval: float = WATCH_INTERVAL) -> Watcher:
+    """Reload ra_tools.py automatically whenever it changes on disk."""
+    path = path or RA_TOOLS_PATH
+    with _reload_lock:
+        # The module already loaded from this file is current; only later changes trigger a reload
+        _loaded_mtimes.setdefault(path, _mtime(path))
+    stop = threading.Event()
+    thread = threading.Thread(target=_watch, args=(path, interval, stop), name="ra_tools-watcher", daemon=True)
+    thread.start()
+    return Watcher(thread, stop)
+
 @mcp.tool
 def hot_reload() -> Dict[str, Any]:
-    """Reload tool implementations from disk without restarting the MCP server."""
-    importlib.invalidate_caches()
-    global ra_tools
-    ra_tools = importlib.reload(ra_tools)
-    ra_tools.set_base_dir(str(BASE_DIR))
-    return {"status": "ok", "reloaded": "ra_tools", "base_dir": str(BASE_DIR)}
+    """Reload tool implementations from disk without restarting the MCP server. Skipped if the new code fails to import."""
+    return _reload()
 
 # Thin wrappers: delegate to the current module
 @mcp.tool
@@ -67,4 +143,6 @@ def next_diagnosticId() -> Dict[str, Any]:
     return _mod().next_diagnosticId()
 
 if __name__ == "__main__":
+    if "--watch" in sys.argv[1:] or os.environ.get("RA_MCP_WATCH") == "1":
+        start_watcher(interval=float(os.environ.get("RA_MCP_WATCH_INTERVAL", WATCH_INTERVAL)))
     mcp.run()
@@ -0,0 +1,35 @@
+# tools/mcp/ra_state.py
+"""
+Long-lived state for the MCP tools.
+
+mcp_server.py reloads ra_tools.py on demand, which replaces all of its module-level
+globals. This module is never reloaded, so the base directory, caches and warm-up
+results kept here survive every reload. Keep tool logic out of this file: a change
+here only takes effect after restarting the server.
+"""
+import threading
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+BASE_DIR: Path = Path(".")
+
+_caches: Dict[str, Dict[Any, Any]] = {}
+_lock = threading.Lock()
+
+def cache(name: str) -> Dict[Any, Any]:
+    """Return the named cache, creating it on first use."""
+    with _lock:
+        return _caches.setdefault(name, {})
+
+def clear(name: Optional[str] = None) -> None:
+    """Drop one named cache, or all of them."""
+    with _lock:
+        if name is None:
+            _caches.clear()
+        else:
+            _caches.pop(name, None)
+
+def stats() -> Dict[str, int]:
+    """Number of entries per cache."""
+    with _lock:
+        return {name: len(entries) for name, entries in _caches.items()}
@@ -9,8 +9,10 @@ import json
 from pathlib import Path
 from typing import Dict, Any, List
 
-# The host passes BASE_DIR in; keep it global here
-BASE_DIR: Path = Path(".")
+import ra_state
+
+# The host passes BASE_DIR in; it lives in ra_state so it survives hot reloads
+BASE_DIR: Path = ra_state.BASE_DIR
 
 DEFAULT_TIMEOUT = 900
 
@@ -33,7 +35,18 @@ def _coverage_exe() -> str:
 
 def set_base_dir(p: str) -> None:
     global BASE_DIR
-    BASE_DIR = Path(p)
+    BASE_DIR = ra_state.BASE_DIR = Path(p)
+
+def _read_lines(p: Path) -> List[str]:
+    """Read a file's lines, cached in ra_state until the file changes."""
+    files = ra_state.cache("file_lines")
+    mtime = p.stat().st_mtime_ns
+    hit = files.get(p)
+    if hit and hit[0] == mtime:
+        return hit[1]
+    lines = p.read_text(encoding="utf-8", errors="replace").splitlines()
+    files[p] = (mtime, lines)
+    return lines
 
 def search_helpers() -> Dict[str, Any]:
     helper_files = [
@@ -56,7 +69,7 @@ def search_helpers() -> Dict[str, Any]:
         p = BASE_DIR / rel
         if not p.exists():
             continue
-        content = p.read_text(encoding="utf-8", errors="replace").splitlines()
+        content = _read_lines(p)
         for i, line in enumerate(content):
             if any(s in line for s in ("public static","Helper.For","ForAllowedSymbols","ForAdditionalFiles")):
                 ctx = content[max(0, i-1): i+3]
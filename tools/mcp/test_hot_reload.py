@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Tests for hot reloading ra_tools.py while keeping ra_state warm.
+
+© 2025 Koninklijke Philips N.V. See License.md in the project root for license information.
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("fastmcp")
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+import mcp_server
+import ra_state
+
+@pytest.fixture
+def ra_tools_copy(monkeypatch):
+    """Point the server at a scratch copy of ra_tools.py so tests can edit it freely."""
+    with tempfile.TemporaryDirectory() as d:
+        path = Path(d) / "ra_tools.py"
+        shutil.copy2(mcp_server.RA_TOOLS_PATH, path)
+        monkeypatch.setattr(mcp_server, "RA_TOOLS_PATH", path)
+        yield path
+    ra_state.clear("test")
+    # Swap the real implementation back in for the rest of the session
+    mcp_server._reload(Path(mcp_server.__file__).parent / "ra_tools.py")
+
+def test_reload_keeps_state(ra_tools_copy):
+    ra_state.cache("test")["warm"] = True
+    ra_tools_copy.write_text(ra_tools_copy.read_text(encoding="utf-8") + "\nRELOADED = 1\n", encoding="utf-8")
+    result = mcp_server.hot_reload()
+    assert result["status"] == "ok"
+    assert mcp_server._mod().RELOADED == 1
+    assert mcp_server._mod().BASE_DIR == mcp_server.BASE_DIR
+    assert ra_state.cache("test")["warm"] is True
+
+def test_reload_skipped_when_import_fails(ra_tools_copy):
+    before = mcp_server._mod()
+    ra_tools_copy.write_text("def broken(:\n", encoding="utf-8")
+    result = mcp_server.hot_reload()
+    assert result["status"] == "skipped"
+    assert "SyntaxError" in result["error"]
+    assert mcp_server._mod() is before
+    assert sys.modules["ra_tools"] is before
+
+def test_failed_first_load_is_not_registered(ra_tools_copy, monkeypatch):
+    monkeypatch.delitem(sys.modules, "ra_tools")
+    ra_tools_copy.write_text("def broken(:\n", encoding="utf-8")
+    assert mcp_server.hot_reload()["status"] == "skipped"
+    assert "ra_tools" not in sys.modules
+
+def _touch(path: Path, text: str) -> None:
+    """Append to the file and move its mtime forward, so the change is seen even on coarse-grained filesystems."""
+    path.write_text(path.read_text(encoding="utf-8") + text, encoding="utf-8")
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+def test_manual_reload_is_not_repeated_by_watcher(ra_tools_copy):
+    _touch(ra_tools_copy, "\nMANUAL = 1\n")
+    assert mcp_server.hot_reload()["status"] == "ok"
+    assert mcp_server._reload(ra_tools_copy, only_if_changed=True) is None
+
+def test_watcher_reloads_on_change(ra_tools_copy):
+    watcher = mcp_server.start_watcher(ra_tools_copy, interval=0.05)
+    try:
+        _touch(ra_tools_copy, "\nWATCHED = 1\n")
+        deadline = time.time() + 5
+        while not hasattr(mcp_server._mod(), "WATCHED") and time.time() < deadline:
+            time.sleep(0.05)
+        assert mcp_server._mod().WATCHED == 1
+    finally:
+        watcher.stop(timeout=5)
+    assert not watcher._thread.is_alive()
@@ -0,0 +1,330 @@
+#!/usr/bin/env python3
+"""
+Deterministic synthetic C# solution generator for analyzer scaling measurements.
+
+Every file is generated from its own random stream seeded with (seed, file index),
+so a corpus of N files is always a prefix of a corpus of 2N files with the same
+settings. This keeps the per-file workload constant while the solution grows.
+
+© 2025 Koninklijke Philips N.V. See License.md in the project root for license information.
+"""
+
+import argparse
+import json
+import random
+import sys
+import uuid
+from dataclasses import dataclass, asdict
+from pathlib import Path
+from typing import Dict, Any, List
+
+SERVICES_PROJECT = "Corpus.Services"
+TESTS_PROJECT = "Corpus.Tests"
+MOQ_VERSION = "4.20.72"
+MSTEST_VERSION = "3.10.4"
+CSHARP_PROJECT_TYPE = "{9A19103F-16F7-4668-BE54-9A1E7A4F7556}"
+HEADER = "// Generated by tools/scaling/corpus_generator.py. Do not edit."
+
+@dataclass
+class CorpusSettings:
+    files: int = 50
+    methods_per_file: int = 10
+    attributes_per_method: int = 2
+    duplication: float = 0.1
+    duplicate_pool: int = 8
+    test_ratio: float = 0.4
+    seed: int = 42
+
+    def validate(self) -> None:
+        if self.files < 1 or self.methods_per_file < 1:
+            raise ValueError("files and methods_per_file must be at least 1")
+        if self.attributes_per_method < 0 or self.duplicate_pool < 1:
+            raise ValueError("attributes_per_method must be >= 0 and duplicate_pool >= 1")
+        if not 0.0 <= self.duplication <= 1.0 or not 0.0 <= self.test_ratio < 1.0:
+            raise ValueError("duplication must be in [0, 1] and test_ratio in [0, 1)")
+
+# Statement shapes used to build method bodies. The duplicate code analyzer hashes
+# token kinds only, so bodies differ structurally (shape order), not just by literals.
+def _statement(rng: random.Random, k: int) -> List[str]:
+    n, m = rng.randint(2, 500), rng.randint(1, 50)
+    shape = rng.randrange(8)
+    if shape == 0:
+        return [f"total += value * {n};"]
+    if shape == 1:
+        return [f"if (total > {n})", "{", f"\ttotal -= {m};", "}"]
+    if shape == 2:
+        return [f"for (var i{k} = 0; i{k} < {m}; i{k}++)", "{", f"\ttotal ^= i{k};", "}"]
+    if shape == 3:
+        return [f"var text{k} = string.Concat(\"item\", total.ToString(CultureInfo.InvariantCulture));",
+                f"total += text{k}.Length;"]
+    if shape == 4:
+        return [f"var list{k} = new List<int> {{ total, {n}, value }};", f"total += list{k}.Count;"]
+    if shape == 5:
+        return [f"total = Math.Max(total, {n}) - Math.Min(value, {m});"]
+    if shape == 6:
+        return ["switch (total % 3)", "{", "\tcase 0:", "\t\ttotal++;", "\t\tbreak;",
+                "\tdefault:", "\t\ttotal--;", "\t\tbreak;", "}"]
+    return [f"while (total > {n})", "{", "\ttotal /= 2;", "}"]
+
+def _body(rng: random.Random, statements: int) -> List[str]:
+    lines = ["var total = value;"]
+    for k in range(statements):
+        lines.extend(_statement(rng, k))
+    lines.append("return total;")
+    return lines
+
+def _duplicate_bodies(settings: CorpusSettings) -> List[List[str]]:
+    # Pool bodies are long enough (well over the default 100 token threshold) to be reported as duplicates
+    rng = random.Random(f"{settings.seed}:pool")
+    return [_body(rng, 12) for _ in range(settings.duplicate_pool)]
+
+def _indent(lines: List[str], depth: int) -> List[str]:
+    return [("\t" * depth + ln) if ln else ln for ln in lines]
+
+def _service_attributes(index: int, method: int, count: int) -> List[str]:
+    attributes = []
+    for a in range(count):
+        if a == 0:
+            attributes.append(f"[Description(\"Service {index} method {method}\")]")
+        else:
+            attributes.append(f"[SuppressMessage(\"Corpus\", \"CORPUS{a:04d}\", Justification = \"Generated\")]")
+    return attributes
+
+def _service_file(settings: CorpusSettings, index: int, rng: random.Random,
+                  pool: List[List[str]], stats: Dict[str, int]) -> str:
+    name = f"Service{index:05d}"
+    methods = range(settings.methods_per_file)
+    interface = [f"int Compute{m}(int value);" for m in methods]
+    members: List[str] = []
+    for m in methods:
+        if rng.random() < settings.duplication:
+            body = pool[rng.randrange(len(pool))]
+            stats["duplicated_methods"] += 1
+        else:
+            body = _body(rng, rng.randint(2, 10))
+        if members:
+            members.append("")
+        members.extend(_service_attributes(index, m, settings.attributes_per_method))
+        members.append(f"public int Compute{m}(int value)")
+        members.append("{")
+        members.extend(_indent(body, 1))
+        members.append("}")
+        stats["methods"] += 1
+        stats["attributes"] += settings.attributes_per_method
+    lines = [
+        HEADER,
+        "using System;",
+        "using System.Collections.Generic;",
+        "using System.ComponentModel;",
+        "using System.Diagnostics.CodeAnalysis;",
+        "using System.Globalization;",
+        "",
+        f"namespace {SERVICES_PROJECT}",
+        "{",
+        f"\tpublic interface I{name}",
+        "\t{",
+        *_indent(interface, 2),
+        "\t}",
+        "",
+        f"\tpublic class {name} : I{name}",
+        "\t{",
+        *_indent(members, 2),
+        "\t}",
+        "}",
+    ]
+    return "\r\n".join(lines) + "\r\n"
+
+def _test_attributes(method: int, count: int) -> List[str]:
+    attributes = ["[TestMethod]"]
+    for a in range(count):
+        if a % 2 == 0:
+            attributes.append(f"[DataRow({method + a})]")
+        else:
+            attributes.append(f"[TestCategory(\"Category{a}\")]")
+    return attributes
+
+def _test_method(rng: random.Random, service: str, method: int, target: int, parameterized: bool) -> List[str]:
+    value = "value" if parameterized else str(rng.randint(1, 100))
+    signature = "(int value)" if parameterized else "()"
+    if rng.random() < 0.5:
+        body = [
+            f"_ = _mock.Setup(m => m.Compute{target}({value})).Returns({value} + 1);",
+            f"var actual = _mock.Object.Compute{target}({value});",
+            f"Assert.AreEqual({value} + 1, actual);",
+            f"_mock.Verify(m => m.Compute{target}(It.IsAny<int>()), Times.Once());",
+        ]
+        name = f"Compute{target}UsesMockCase{method}"
+    else:
+        body = [
+            f"Mock<I{service}> strict = new(MockBehavior.Strict);",
+            f"_ = strict.Setup(m => m.Compute{target}(It.IsAny<int>())).Returns(0);",
+            f"var sut = new {service}();",
+            f"var expected = sut.Compute{target}({value});",
+            f"Assert.AreEqual(expected, sut.Compute{target}({value}));",
+            f"Assert.AreEqual(0, strict.Object.Compute{target}({value}));",
+        ]
+        name = f"Compute{target}IsStableCase{method}"
+    return [f"public void {name}{signature}", "{", *_indent(body, 1), "}"]
+
+def _test_file(settings: CorpusSettings, index: int, service_index: int, rng: random.Random,
+               stats: Dict[str, int]) -> str:
+    service = f"Service{service_index:05d}"
+    members = [
+        f"private Mock<I{service}> _mock;",
+        "",
+        "[TestInitialize]",
+        "public void Initialize()",
+        "{",
+        f"\t_mock = new Mock<I{service}>();",
+        "}",
+    ]
+    parameterized = settings.attributes_per_method > 0
+    for m in range(settings.methods_per_file):
+        target = rng.randrange(settings.methods_per_file)
+        members.append("")
+        members.extend(_test_attributes(m, settings.attributes_per_method))
+        members.extend(_test_method(rng, service, m, target, parameterized))
+        stats["methods"] += 1
+        stats["attributes"] += settings.attributes_per_method + 1
+    lines = [
+        HEADER,
+        f"using {SERVICES_PROJECT};",
+        "using Microsoft.VisualStudio.TestTools.UnitTesting;",
+        "using Moq;",
+        "",
+        f"namespace {TESTS_PROJECT}",
+        "{",
+        "\t[TestClass]",
+        f"\tpublic class {service}Tests{index:05d}",
+        "\t{",
+        *_indent(members, 2),
+        "\t}",
+        "}",
+    ]
+    return "\r\n".join(lines) + "\r\n"
+
+def _project(package_references: List[str], project_reference: str = "") -> str:
+    lines = [
+        "<Project Sdk=\"Microsoft.NET.Sdk\">",
+        "  <PropertyGroup>",
+        "    <TargetFramework>net8.0</TargetFramework>",
+        "    <ImplicitUsings>disable</ImplicitUsings>",
+        "    <Nullable>disable</Nullable>",
+        "    <IsPackable>false</IsPackable>",
+        "    <ReportAnalyzer>true</ReportAnalyzer>",
+        "    <TreatWarningsAsErrors>false</TreatWarningsAsErrors>",
+        "  </PropertyGroup>",
+    ]
+    if package_references:
+        lines.append("  <ItemGroup>")
+        lines.extend(package_references)
+        lines.append("  </ItemGroup>")
+    if project_reference:
+        lines.append("  <ItemGroup>")
+        lines.append(f"    <ProjectReference Include=\"{project_reference}\" />")
+        lines.append("  </ItemGroup>")
+    lines.append("</Project>")
+    return "\n".join(lines) + "\n"
+
+def _project_guid(seed: int, name: str) -> str:
+    return "{" + str(uuid.uuid5(uuid.NAMESPACE_URL, f"roslyn-analyzers-corpus/{seed}/{name}")).upper() + "}"
+
+def _solution(seed: int) -> str:
+    projects = [(name, _project_guid(seed, name)) for name in (SERVICES_PROJECT, TESTS_PROJECT)]
+    lines = [
+        "",
+        "Microsoft Visual Studio Solution File, Format Version 12.00",
+        "# Visual Studio Version 17",
+        "VisualStudioVersion = 17.0.31903.59",
+        "MinimumVisualStudioVersion = 10.0.40219.1",
+    ]
+    for name, guid in projects:
+        lines.append(f"Project(\"{CSHARP_PROJECT_TYPE}\") = \"{name}\", \"{name}\\{name}.csproj\", \"{guid}\"")
+        lines.append("EndProject")
+    lines.extend([
+        "Global",
+        "\tGlobalSection(SolutionConfigurationPlatforms) = preSolution",
+        "\t\tDebug|Any CPU = Debug|Any CPU",
+        "\t\tRelease|Any CPU = Release|Any CPU",
+        "\tEndGlobalSection",
+        "\tGlobalSection(ProjectConfigurationPlatforms) = postSolution",
+    ])
+    for _, guid in projects:
+        for config in ("Debug", "Release"):
+            lines.append(f"\t\t{guid}.{config}|Any CPU.ActiveCfg = {config}|Any CPU")
+            lines.append(f"\t\t{guid}.{config}|Any CPU.Build.0 = {config}|Any CPU")
+    lines.extend(["\tEndGlobalSection", "EndGlobal"])
+    return "\r\n".join(lines) + "\r\n"
+
+def generate_corpus(output: Path, settings: CorpusSettings) -> Dict[str, Any]:
+    """Write a two-project solution (services and MsTest/Moq tests) into output and return its statistics."""
+    settings.validate()
+    output = Path(output)
+    services_dir = output / SERVICES_PROJECT
+    tests_dir = output / TESTS_PROJECT
+    for d in (services_dir, tests_dir):
+        d.mkdir(parents=True, exist_ok=True)
+        for stale in d.glob("*.cs"):
+            stale.unlink()
+
+    stats = {"files": settings.files, "service_files": 0, "test_files": 0, "methods": 0,
+             "attributes": 0, "duplicated_methods": 0, "lines": 0}
+    pool = _duplicate_bodies(settings)
+    last_service = -1
+    for i in range(settings.files):
+        rng = random.Random(f"{settings.seed}:{i}")
+        # A test file needs a service to target, so the first file is always a service
+        if last_service >= 0 and rng.random() < settings.test_ratio:
+            content = _test_file(settings, i, last_service, rng, stats)
+            path = tests_dir / f"Service{last_service:05d}Tests{i:05d}.cs"
+            stats["test_files"] += 1
+        else:
+            content = _service_file(settings, i, rng, pool, stats)
+            path = services_dir / f"Service{i:05d}.cs"
+            last_service = i
+            stats["service_files"] += 1
+        stats["lines"] += content.count("\n")
+        path.write_bytes(content.encode("utf-8-sig"))
+
+    (services_dir / f"{SERVICES_PROJECT}.csproj").write_text(_project([]), encoding="utf-8")
+    (tests_dir / f"{TESTS_PROJECT}.csproj").write_text(_project([
+        f"    <PackageReference Include=\"Moq\" Version=\"{MOQ_VERSION}\" />",
+        f"    <PackageReference Include=\"MSTest.TestFramework\" Version=\"{MSTEST_VERSION}\" />",
+    ], f"..\\{SERVICES_PROJECT}\\{SERVICES_PROJECT}.csproj"), encoding="utf-8")
+    (output / "Corpus.sln").write_bytes(_solution(settings.seed).encode("utf-8-sig"))
+    (output / "corpus.json").write_text(json.dumps({"settings": asdict(settings), "stats": stats}, indent=2),
+                                        encoding="utf-8")
+    return stats
+
+def add_settings_arguments(parser: argparse.ArgumentParser) -> None:
+    defaults = CorpusSettings()
+    parser.add_argument("--methods-per-file", type=int, default=defaults.methods_per_file)
+    parser.add_argument("--attributes-per-method", type=int, default=defaults.attributes_per_method)
+    parser.add_argument("--duplication", type=float, default=defaults.duplication,
+                        help="Fraction of service methods whose body is copied from a shared pool")
+    parser.add_argument("--duplicate-pool", type=int, default=defaults.duplicate_pool,
+                        help="Number of distinct duplicated bodies")
+    parser.add_argument("--test-ratio", type=float, default=defaults.test_ratio,
+                        help="Fraction of files that are MsTest/Moq test classes")
+    parser.add_argument("--seed", type=int, default=defaults.seed)
+
+def settings_from_arguments(args: argparse.Namespace, files: int) -> CorpusSettings:
+    return CorpusSettings(files=files, methods_per_file=args.methods_per_file,
+                          attributes_per_method=args.attributes_per_method, duplication=args.duplication,
+                          duplicate_pool=args.duplicate_pool, test_ratio=args.test_ratio, seed=args.seed)
+
+def main(argv: List[str]) -> int:
+    parser = argparse.ArgumentParser(description="Generate a deterministic synthetic C# solution.")
+    parser.add_argument("output", type=Path, help="Directory to write the solution into")
+    parser.add_argument("--files", type=int, default=CorpusSettings.files)
+    add_settings_arguments(parser)
+    args = parser.parse_args(argv)
+    try:
+        stats = generate_corpus(args.output, settings_from_arguments(args, args.files))
+    except ValueError as e:
+        parser.error(str(e))
+    print(json.dumps(stats, indent=2))
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,264 @@
+#!/usr/bin/env python3
+"""
+Measure how analyzer time grows with solution size.
+
+Generates synthetic solutions (see corpus_generator.py) whose file count grows
+geometrically, builds each one with the Dogfood analyzer packages and
+ReportAnalyzer enabled, extracts per-analyzer times from the binlog with
+Philips.CodeAnalysis.AnalyzerPerformance, and fits a time-versus-size exponent
+per analyzer. An exponent near 1 is linear; anything well above it is flagged.
+
+© 2025 Koninklijke Philips N.V. See License.md in the project root for license information.
+"""
+
+import argparse
+import csv
+import json
+import math
+import re
+import shutil
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Tuple
+
+from corpus_generator import generate_corpus, add_settings_arguments, settings_from_arguments
+
+BASE_DIR = Path(__file__).resolve().parents[2]
+DEFAULT_TIMEOUT = 1800
+# Same packages as the consumption props in .github/workflows/performance.yml and ra_tools.run_dogfood
+DOGFOOD_PACKAGES = [
+    "Philips.CodeAnalysis.MaintainabilityAnalyzers.Dogfood",
+    "Philips.CodeAnalysis.DuplicateCodeAnalyzer.Dogfood",
+    "Philips.CodeAnalysis.SecurityAnalyzers.Dogfood",
+    "Philips.CodeAnalysis.MsTestAnalyzers.Dogfood",
+    "Philips.CodeAnalysis.MoqAnalyzers.Dogfood",
+]
+PERFORMANCE_PROJECT = "Philips.CodeAnalysis.AnalyzerPerformance"
+ROW = re.compile(r"^\|\s*([A-Z]+\d+)\s*\|\s*([^|]*?)\s*\|\s*([^|]*?)\s*\|\s*([\d.,]+)\s*(ms|s)\s*\|$")
+
+def _run(cmd: List[str], cwd: Path, timeout: int = DEFAULT_TIMEOUT) -> Tuple[int, str]:
+    p = subprocess.run(cmd, cwd=cwd, capture_output=True, text=True, shell=False, timeout=timeout)
+    return p.returncode, (p.stdout or "") + (p.stderr or "")
+
+def build_dogfood_packages() -> None:
+    """Build the .Dogfood analyzer packages into Packages/, as the dogfood workflow does."""
+    # Mirrors step 1 of tools/mcp/ra_tools.py::run_dogfood; keep the two in sync
+    props = BASE_DIR / "Directory.Build.props"
+    backup = None
+    try:
+        if props.exists():
+            backup = props.with_suffix(".props.backup")
+            shutil.copy2(props, backup)
+        props.write_text("""<Project>
+  <PropertyGroup>
+    <PackageId>$(MSBuildProjectName).Dogfood</PackageId>
+  </PropertyGroup>
+</Project>
+""", encoding="utf-8")
+        rc, out = _run(["dotnet", "build", "--configuration", "Release"], BASE_DIR)
+    finally:
+        if props.exists():
+            props.unlink()
+        if backup and backup.exists():
+            shutil.move(backup, props)
+    if rc != 0:
+        raise RuntimeError("Failed to build dogfood packages:\n" + out[-4000:])
+
+def build_performance_tool() -> Path:
+    project = BASE_DIR / PERFORMANCE_PROJECT / f"{PERFORMANCE_PROJECT}.csproj"
+    rc, out = _run(["dotnet", "build", str(project), "--configuration", "Release"], BASE_DIR)
+    if rc != 0:
+        raise RuntimeError(f"Failed to build {PERFORMANCE_PROJECT}:\n" + out[-4000:])
+    return BASE_DIR / PERFORMANCE_PROJECT / "bin" / "Release" / "net8.0" / f"{PERFORMANCE_PROJECT}.dll"
+
+def prepare_output(output: Path) -> None:
+    """Write the props, editorconfig and nuget.config shared by every generated solution under output."""
+    output.mkdir(parents=True, exist_ok=True)
+    references = "\n".join(f"""    <PackageReference Include="{p}" Version="1.0.0">
+      <PrivateAssets>all</PrivateAssets>
+      <IncludeAssets>runtime; build; native; contentfiles; analyzers; buildtransitive</IncludeAssets>
+    </PackageReference>""" for p in DOGFOOD_PACKAGES)
+    # A root Directory.Build.props stops MSBuild from picking up the repository's own props
+    (output / "Directory.Build.props").write_text(f"""<Project>
+  <PropertyGroup>
+    <FileVersion>1.0.0</FileVersion>
+    <ReportAnalyzer>true</ReportAnalyzer>
+  </PropertyGroup>
+  <ItemGroup>
+{references}
+  </ItemGroup>
+</Project>
+""", encoding="utf-8")
+    # Enable every analyzer, including those that are off by default, and configure the PH rules
+    # exactly as .github/workflows/performance.yml does, so the same analyzer work is timed
+    (output / ".editorconfig").write_text("""root = true
+[*.cs]
+dotnet_analyzer_diagnostic.severity = warning
+dotnet_code_quality.PH2075.assembly_version = 1.0.3.0
+dotnet_code_quality.PH2079.namespace_prefix = Philips.CodeAnalysis
+dotnet_diagnostic.PH2006.severity = none
+dotnet_diagnostic.PH2015.severity = none
+""", encoding="utf-8")
+    packages_cache = output / ".nuget" / "packages"
+    (output / "nuget.config").write_text(f"""<?xml version="1.0" encoding="utf-8"?>
+<configuration>
+  <config>
+    <add key="globalPackagesFolder" value="{packages_cache}" />
+  </config>
+  <packageSources>
+    <add key="dogfood" value="{BASE_DIR / 'Packages'}" />
+    <add key="nuget.org" value="https://api.nuget.org/v3/index.json" />
+  </packageSources>
+</configuration>
+""", encoding="utf-8")
+    # Dogfood packages are always version 1.0.0, so drop cached copies to pick up the fresh build
+    if packages_cache.exists():
+        for cached in packages_cache.glob("philips.codeanalysis.*.dogfood"):
+            shutil.rmtree(cached)
+
+def parse_performance(output: str) -> Dict[str, Dict[str, Any]]:
+    """Parse the AnalyzerPerformance markdown table into {id: {package, analyzer, ms}}."""
+    records: Dict[str, Dict[str, Any]] = {}
+    for line in output.splitlines():
+        m = ROW.match(line.strip())
+        if not m:
+            continue
+        rule_id, package, analyzer, time, unit = m.groups()
+        ms = float(time.replace(",", ".")) * (1000.0 if unit == "s" else 1.0)
+        record = records.setdefault(rule_id, {"package": package, "analyzer": analyzer, "ms": 0.0})
+        record["ms"] += ms
+    return records
+
+def measure(corpus: Path, performance_tool: Path) -> Tuple[Dict[str, Dict[str, Any]], Optional[str]]:
+    binlog = corpus / "msbuild.binlog"
+    try:
+        rc, out = _run(["dotnet", "build", "Corpus.sln", "--configuration", "Debug", "--no-incremental",
+                        f"-bl:{binlog}", "/p:RunAnalyzersDuringBuild=true", "-consoleloggerparameters:NoSummary"],
+                       corpus)
+        if rc != 0 or not binlog.exists():
+            return {}, "Build failed:\n" + out[-4000:]
+        rc, out = _run(["dotnet", str(performance_tool), str(binlog), "Philips.CodeAnalysis"], corpus, timeout=600)
+    except subprocess.TimeoutExpired as e:
+        # Report it like a failed build so the sizes measured so far are still written out
+        return {}, f"Timed out after {e.timeout:g} s: {' '.join(e.cmd)}"
+    if rc != 0:
+        return {}, f"{PERFORMANCE_PROJECT} failed:\n" + out[-4000:]
+    return parse_performance(out), None
+
+def fit_exponent(sizes: List[float], times: List[float]) -> Optional[float]:
+    """Least-squares slope of log(time) against log(size); None when fewer than two usable points."""
+    points = [(math.log(s), math.log(t)) for s, t in zip(sizes, times) if s > 0 and t > 0]
+    if len(points) < 2:
+        return None
+    mean_x = sum(x for x, _ in points) / len(points)
+    mean_y = sum(y for _, y in points) / len(points)
+    sxx = sum((x - mean_x) ** 2 for x, _ in points)
+    if sxx == 0:
+        return None
+    return sum((x - mean_x) * (y - mean_y) for x, y in points) / sxx
+
+def summarize(runs: List[Dict[str, Any]], threshold: float, min_ms: float) -> List[Dict[str, Any]]:
+    sizes = [float(r["stats"]["methods"]) for r in runs]
+    ids = sorted({rule_id for r in runs for rule_id in r["analyzers"]})
+    curves = []
+    for rule_id in ids:
+        entries = [r["analyzers"].get(rule_id) for r in runs]
+        known = next(e for e in entries if e)
+        times = [e["ms"] if e else 0.0 for e in entries]
+        exponent = fit_exponent(sizes, times)
+        superlinear = exponent is not None and exponent > threshold and max(times) >= min_ms
+        curves.append({"id": rule_id, "package": known["package"], "analyzer": known["analyzer"],
+                       "times_ms": times, "exponent": exponent, "superlinear": superlinear})
+    curves.sort(key=lambda c: (not c["superlinear"], -(c["exponent"] or 0.0), c["id"]))
+    return curves
+
+def render_markdown(runs: List[Dict[str, Any]], curves: List[Dict[str, Any]], threshold: float) -> str:
+    measured = [r for r in runs if not r["error"]]
+    files = [r["stats"]["files"] for r in measured]
+    lines = ["### Analyzer Scaling",
+             "Sizes (files/methods): " + ", ".join(f"{r['stats']['files']}/{r['stats']['methods']}" for r in measured),
+             "",
+             "| Id | Package | Analyzer | " + " | ".join(f"{f} files" for f in files) + " | Exponent | |",
+             "| -- | ------- | -------- | " + " | ".join("----" for _ in files) + " | -------- | - |"]
+    for c in curves:
+        exponent = f"{c['exponent']:.2f}" if c["exponent"] is not None else "n/a"
+        flag = f"superlinear (> {threshold:g})" if c["superlinear"] else ""
+        times = " | ".join(f"{t:.0f} ms" for t in c["times_ms"])
+        lines.append(f"| {c['id']} | {c['package']} | {c['analyzer']} | {times} | {exponent} | {flag} |")
+    if not curves:
+        lines.append("No performance data found")
+    errors = [f"- {r['stats']['files']} files: {r['error'].splitlines()[0]}" for r in runs if r["error"]]
+    if errors:
+        lines.extend(["", "Failed sizes:", *errors])
+    return "\n".join(lines)
+
+def write_results(output: Path, runs: List[Dict[str, Any]], curves: List[Dict[str, Any]]) -> None:
+    (output / "scaling.json").write_text(json.dumps({"runs": runs, "curves": curves}, indent=2), encoding="utf-8")
+    with open(output / "scaling.csv", "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(["id", "package", "analyzer", "files", "methods", "lines", "ms"])
+        measured = [r for r in runs if not r["error"]]
+        for c in curves:
+            for r, ms in zip(measured, c["times_ms"]):
+                writer.writerow([c["id"], c["package"], c["analyzer"],
+                                 r["stats"]["files"], r["stats"]["methods"], r["stats"]["lines"], ms])
+
+def geometric_sizes(start: int, factor: float, steps: int) -> List[int]:
+    sizes: List[int] = []
+    for k in range(steps):
+        size = max(1, int(round(start * factor ** k)))
+        if not sizes or size > sizes[-1]:
+            sizes.append(size)
+    return sizes
+
+def main(argv: List[str]) -> int:
+    parser = argparse.ArgumentParser(description="Plot per-analyzer time against synthetic solution size.")
+    parser.add_argument("--output", type=Path, default=Path(tempfile.gettempdir()) / "roslyn-analyzers-scaling",
+                        help="Working directory for generated solutions and results (keep it outside the repository)")
+    parser.add_argument("--start-files", type=int, default=25)
+    parser.add_argument("--factor", type=float, default=2.0, help="Growth factor between consecutive sizes")
+    parser.add_argument("--steps", type=int, default=5)
+    parser.add_argument("--threshold", type=float, default=1.25,
+                        help="Exponent above which an analyzer is reported as superlinear")
+    parser.add_argument("--min-ms", type=float, default=50.0,
+                        help="Ignore analyzers whose largest time is below this, as their curves are noise")
+    parser.add_argument("--skip-dogfood-build", action="store_true",
+                        help="Reuse the .Dogfood packages already in Packages/")
+    add_settings_arguments(parser)
+    args = parser.parse_args(argv)
+    if args.factor <= 1.0 or args.steps < 2:
+        parser.error("factor must be > 1 and steps >= 2")
+    sizes = geometric_sizes(args.start_files, args.factor, args.steps)
+    if len(sizes) < 2:
+        parser.error(f"start-files, factor and steps give only {len(sizes)} distinct size(s); at least 2 are needed")
+    try:
+        # Check corpus settings before the dogfood and performance tool builds, which take minutes
+        settings_from_arguments(args, sizes[0]).validate()
+    except ValueError as e:
+        parser.error(str(e))
+
+    if not args.skip_dogfood_build:
+        print("Building dogfood packages...", file=sys.stderr)
+        build_dogfood_packages()
+    performance_tool = build_performance_tool()
+    output = args.output.resolve()
+    prepare_output(output)
+
+    runs: List[Dict[str, Any]] = []
+    for files in sizes:
+        corpus = output / f"files-{files:05d}"
+        stats = generate_corpus(corpus, settings_from_arguments(args, files))
+        print(f"Measuring {files} files ({stats['methods']} methods)...", file=sys.stderr)
+        analyzers, error = measure(corpus, performance_tool)
+        runs.append({"stats": stats, "analyzers": analyzers, "error": error})
+
+    measured = [r for r in runs if not r["error"]]
+    curves = summarize(measured, args.threshold, args.min_ms)
+    write_results(output, runs, curves)
+    print(render_markdown(runs, curves, args.threshold))
+    return 1 if any(c["superlinear"] for c in curves) or len(measured) < len(runs) else 0
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
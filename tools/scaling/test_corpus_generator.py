@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+Tests for the synthetic corpus generator and the scaling curve fit.
+
+© 2025 Koninklijke Philips N.V. See License.md in the project root for license information.
+"""
+
+import sys
+import tempfile
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from corpus_generator import CorpusSettings, generate_corpus
+from scaling_curves import fit_exponent, geometric_sizes, parse_performance
+
+def _snapshot(root: Path) -> dict:
+    return {p.relative_to(root).as_posix(): p.read_bytes() for p in sorted(root.rglob("*.cs"))}
+
+def test_generation_is_deterministic():
+    with tempfile.TemporaryDirectory() as a, tempfile.TemporaryDirectory() as b:
+        generate_corpus(Path(a), CorpusSettings(files=12, seed=7))
+        generate_corpus(Path(b), CorpusSettings(files=12, seed=7))
+        assert _snapshot(Path(a)) == _snapshot(Path(b))
+
+def test_smaller_corpus_is_prefix_of_larger():
+    with tempfile.TemporaryDirectory() as a, tempfile.TemporaryDirectory() as b:
+        generate_corpus(Path(a), CorpusSettings(files=8))
+        generate_corpus(Path(b), CorpusSettings(files=16))
+        small, large = _snapshot(Path(a)), _snapshot(Path(b))
+        assert all(large[name] == content for name, content in small.items())
+
+def test_statistics_follow_settings():
+    with tempfile.TemporaryDirectory() as d:
+        stats = generate_corpus(Path(d), CorpusSettings(files=20, methods_per_file=5, duplication=1.0))
+        assert stats["service_files"] + stats["test_files"] == 20
+        assert stats["test_files"] > 0
+        assert stats["methods"] == 100
+        assert stats["duplicated_methods"] == stats["service_files"] * 5
+        assert (Path(d) / "Corpus.sln").exists()
+
+def test_parse_performance_table():
+    records = parse_performance("\n".join([
+        "| Id | Package | Analyzer | Time |",
+        "| -- | ------- | -------- | ---- |",
+        "| PH2071 | DuplicateCodeAnalyzer | AvoidDuplicateCodeAnalyzer | 1.5 s |",
+        "| PH2020 | MaintainabilityAnalyzers | AvoidThisAnalyzer | 12 ms |",
+    ]))
+    assert records["PH2071"]["ms"] == 1500.0
+    assert records["PH2020"]["ms"] == 12.0
+
+def test_fit_exponent():
+    sizes = [100.0, 200.0, 400.0, 800.0]
+    assert abs(fit_exponent(sizes, [s * 0.5 for s in sizes]) - 1.0) < 1e-9
+    assert abs(fit_exponent(sizes, [s * s for s in sizes]) - 2.0) < 1e-9
+    assert fit_exponent(sizes, [0.0, 0.0, 0.0, 5.0]) is None
+
+def test_geometric_sizes():
+    assert geometric_sizes(25, 2.0, 4) == [25, 50, 100, 200]
+    assert geometric_sizes(1, 1.3, 5) == [1, 2, 3]
+    # Sizes that round to the same value collapse, leaving too few points for a curve
+    assert geometric_sizes(1, 1.1, 2) == [1]
+
+if __name__ == "__main__":
+    tests = [f for name, f in sorted(globals().items()) if name.startswith("test_") and callable(f)]
+    for test in tests:
+        test()
+        print(f"✅ {test.__name__}")
+    print(f"🎉 {len(tests)} tests passed")